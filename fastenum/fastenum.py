@@ -6,8 +6,12 @@ metaclasses properly.
 More on this topic https://mypy.readthedocs.io/en/latest/metaclasses.html
 '''
 
-from typing import cast, Any, Tuple, Iterator, Type
-import collections
+from typing import cast, Any, Dict, Tuple, Iterator, Type
+import sys
+
+
+# Sentinel for by-value lookups, distinguishes a miss from a member whose value is None.
+_MISSING = object()
 
 
 def _is_descriptor(obj: Any) -> bool:
@@ -20,9 +24,10 @@ class EnumMeta(type):
 	# Ignoring mypy annotation at prepare method
 	# as mypy does not understand metaclasses properly
 	@classmethod
-	def __prepare__(mcs, cls: type, bases: Tuple[type, ...]) -> collections.OrderedDict:  # type: ignore
+	def __prepare__(mcs, cls: type, bases: Tuple[type, ...]) -> Dict[str, Any]:  # type: ignore
 		# pylint: disable=unused-argument
-		return collections.OrderedDict()
+		# Plain dicts preserve insertion order, so member definition order is kept.
+		return {}
 
 	# Not sure why we get 'Incompatible return type for "__new__" (returns "Enum", but must return
 	#   a subtype of "EnumMeta")' here:
@@ -30,26 +35,35 @@ class EnumMeta(type):
 		mcs,
 		cls: str,
 		bases: Tuple[type, ...],
-		classdict: collections.OrderedDict,
+		classdict: Dict[str, Any],
 	) -> 'EnumMeta':
 		# pylint: disable=protected-access
 		enum_class = super().__new__(mcs, cls, bases, classdict)
 		# name->value map
-		enum_class._member_map_ = collections.OrderedDict()  # type: ignore
+		enum_class._member_map_ = {}  # type: ignore
 		# Reverse value->name map for hashable values.
 		enum_class._value_to_member_map_ = {}  # type: ignore
+		# Enum itself does not define __init__, so calling it per member would only
+		# run object.__init__. Call it only when a subclass defines its own.
+		call_init = enum_class.__init__ is not object.__init__  # type: ignore
+		# Whether every member value made it to the reverse map.
+		all_hashable = True
 
 		for name, value in classdict.items():
-			if not name.startswith('_') and not _is_descriptor(value):
+			if name[:1] != '_' and not _is_descriptor(value):
 				member = enum_class.__new__(enum_class)  # type: ignore
+				# Separate attribute stores are faster than a bulk member.__dict__.update(),
+				# which has to build a keyword dict first.
 				member.name = name
 				member.value = value
-				# name and value are not expected to change, so we can cache __repr__ and __hash__.
-				member._repr = '<%s.%s: %r>' % (enum_class.__name__, name, value)
+				# name and value are not expected to change, so we can cache __repr__, __str__ and __hash__.
+				member._repr = sys.intern('<%s.%s: %r>' % (enum_class.__name__, name, value))
+				member._str = sys.intern('%s.%s' % (enum_class.__name__, name))
 				member._hash = hash(name)
 
-				# args = value if isinstance(value, tuple) else (value,)
-				member.__init__()
+				if call_init:
+					# args = value if isinstance(value, tuple) else (value,)
+					member.__init__()
 				setattr(enum_class, name, member)
 				enum_class._member_map_[name] = member  # type: ignore
 				try:
@@ -57,22 +71,47 @@ class EnumMeta(type):
 					# to the map, and by-value lookups for this value will be linear.
 					enum_class._value_to_member_map_[value] = member  # type: ignore
 				except TypeError:
-					pass
+					all_hashable = False
+
+		# Members are fixed once the class is created, so their sequence and count can be cached.
+		enum_class._members_tuple_ = tuple(enum_class._member_map_.values())  # type: ignore
+		# Values in the same order as _members_tuple_, so scans by value don't touch member objects.
+		enum_class._values_tuple_ = tuple(member.value for member in enum_class._members_tuple_)  # type: ignore
+		enum_class._member_count_ = len(enum_class._members_tuple_)  # type: ignore
+
+		# Bound method of the reverse map so that by-value lookups in __call__ are a single call.
+		enum_class._value_to_member_get_ = enum_class._value_to_member_map_.get  # type: ignore
+		# With all values in the reverse map there is nothing for the linear search to find,
+		# so __call__ skips it for this class.
+		enum_class._linear_search_ = not all_hashable  # type: ignore
 
 		return cast(EnumMeta, enum_class)
 
 	def __call__(cls, value: Any) -> 'Enum':  # type: ignore
-		# For lookups like Color(Color.red)
-		if isinstance(value, cls):
+		# For lookups like Color(Color.red), a pointer comparison covers the common case.
+		if type(value) is cls:  # pylint: disable=unidiomatic-typecheck
 			return value
 		# by-value search for a matching enum member
 		# see if it's in the reverse mapping (for hashable values)
+		# Plain class attribute loads are served from the type attribute cache,
+		# going through cls.__dict__ instead would build a mappingproxy on every call.
 		try:
-			return cls._value_to_member_map_[value]  # type: ignore
-		except (KeyError, TypeError):
-			# not there, now do long search -- O(n) behavior
-			for member in cls._member_map_.values():  # type: ignore
-				if member.value == value:
+			member = cls._value_to_member_get_(value, _MISSING)  # type: ignore
+		except TypeError:
+			# value is not hashable, so it can't be in the map
+			pass
+		else:
+			if member is not _MISSING:
+				return member
+			# Members of subclasses, checked only after the map
+			# because by-value lookups are the dominant case.
+			if isinstance(value, cls):
+				return value
+		# Any value, hashable or not, may still compare equal to an unhashable member value
+		# (e.g. frozenset({1}) == {1}) -- O(n) search. Enums with only hashable values skip it.
+		if cls._linear_search_:  # type: ignore
+			for member_value, member in zip(cls._values_tuple_, cls._members_tuple_):  # type: ignore
+				if member_value == value:
 					return member
 		raise ValueError('%s is not a valid %s' % (value, cls.__name__))
 
@@ -80,13 +119,13 @@ class EnumMeta(type):
 		return cls._member_map_[name]  # type: ignore
 
 	def __iter__(cls) -> Iterator['Enum']:
-		return (v for v in cls._member_map_.values())  # type: ignore
+		return iter(cls._members_tuple_)  # type: ignore
 
 	def __reversed__(cls) -> Iterator['Enum']:
-		return reversed(list(cls))
+		return reversed(cls._members_tuple_)  # type: ignore
 
 	def __len__(cls) -> int:
-		return len(cls._member_map_)  # type: ignore
+		return cls._member_count_  # type: ignore
 
 
 class Enum(metaclass = EnumMeta):
@@ -95,7 +134,8 @@ class Enum(metaclass = EnumMeta):
 		return self._repr  # type: ignore
 
 	def __str__(self) -> str:
-		return '%s.%s' % (self.__class__.__name__, self.name)  # type: ignore
+		# cache of `'%s.%s' % (self.__class__.__name__, self.name)`
+		return self._str  # type: ignore
 
 	def __hash__(self) -> int:
 		# cache of `hash(self.name)`
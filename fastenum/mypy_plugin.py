@@ -51,37 +51,52 @@ So this way we will collide with the original Enum definition in the Python stan
 '''
 
 from typing import Type, Optional, Callable, List, Union
+import functools
 
 from mypy import nodes, types
 import mypy.plugin
 
 
 # Define under which names the mypy plugin should be registered
-REGISTER = {
+REGISTER = frozenset({
 	'fastenum.Enum',
 	# To support for example :code:`controllers.orders.types.fastenum`
 	'.fastenum',
 	# Might hijack Enum from standard library but should still work as expected.
 	# Unfortunately there is no other way to work with :code:`from fastenum import Enum`
 	'Enum',
-}
+})
 
 # This is needed to shadow some classes and ignore them by this plugin
-BLACKLIST = {
+BLACKLIST = frozenset({
 	'FastEnumPlugin',
 	'fastenum.mypy_plugin.Plugin',
-}
+})
 
+# Registered names are matched as substrings, so a name containing another
+# registered name (e.g. 'fastenum.Enum' contains 'Enum') never changes the result.
+# Keep only the names that are not redundant so each fullname is scanned fewer times.
+_SUBSTR_REGISTER = tuple(
+	r
+	for r in REGISTER
+	if not any(other != r and other in r for other in REGISTER)
+)
 
+
+@functools.lru_cache(maxsize = None)
 def _is_fullname_supported(fullname: str) -> bool:
 	'''
 	Helper function to specify if given fullname is usable by our plugin
+
+	Mypy asks both hooks about the same fullnames over and over,
+	so the result is memoized (fullnames are bounded by the analyzed code).
 	'''
-	for r in REGISTER:
-		if r in fullname and fullname not in BLACKLIST:
-			return True
+	# Reject shadowed names up front with a single set lookup
+	# instead of re-checking the blacklist for every matching pattern.
+	if fullname in BLACKLIST:
+		return False
 
-	return False
+	return any(r in fullname for r in _SUBSTR_REGISTER)
 
 
 def _define_method(
@@ -558,12 +573,12 @@ def transform_enum_type(context: mypy.plugin.AnalyzeTypeContext) -> types.Type:
 
 	# Because enums can be used even in comparison expression like `A > B`
 	# we have to support these methods in our fake enum class too.
-	def def_bool_method(name: str) -> None:
+	for name in ('le', 'eq', 'ne', 'ge', 'gt'):
 		_define_method(
 			context,
 			enum_info,
 			context.type.name,
-			name,
+			f'__{name}__',
 			[
 				nodes.Argument(nodes.Var('self', enum_instance), enum_instance, None, nodes.ARG_POS),
 				nodes.Argument(nodes.Var('other', enum_instance), enum_instance, None, nodes.ARG_POS),
@@ -571,9 +586,6 @@ def transform_enum_type(context: mypy.plugin.AnalyzeTypeContext) -> types.Type:
 			bool_type,
 		)
 
-	for name in ('le', 'eq', 'ne', 'ge', 'gt'):
-		def_bool_method(f'__{name}__')
-
 	#
 	# After all this we end up with:
 	#
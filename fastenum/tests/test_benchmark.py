@@ -22,7 +22,22 @@ class FastEnum(fastenum.Enum):
 	D = 4
 
 
+class DenseEnum(enum.Enum):
+	A = 0
+	B = 1
+	C = 2
+	D = 3
+
+
+class DenseFastEnum(fastenum.Enum):
+	A = 0
+	B = 1
+	C = 2
+	D = 3
+
+
 EnumClasses = Union[Type[Enum], Type[FastEnum]]
+DenseEnumClasses = Union[Type[DenseEnum], Type[DenseFastEnum]]
 
 
 parametrize_enum_classes = pytest.mark.parametrize(
@@ -65,6 +80,32 @@ def test_call(
 	benchmark(test)
 
 
+@pytest.mark.parametrize(
+	'enum_class',
+	(DenseEnum, DenseFastEnum),
+	ids = ('enum', 'fastenum'),
+)
+def test_call_dense(
+	enum_class: DenseEnumClasses,
+	benchmark: pytest_benchmark.fixture.BenchmarkFixture,
+) -> None:
+	def test() -> None:
+		enum_class(2)  # type: ignore
+
+	benchmark(test)
+
+
+@parametrize_enum_classes
+def test_call_with_member(
+	enum_class: EnumClasses,
+	benchmark: pytest_benchmark.fixture.BenchmarkFixture,
+) -> None:
+	def test() -> None:
+		enum_class(enum_class.C)  # type: ignore
+
+	benchmark(test)
+
+
 @parametrize_enum_classes
 def test_iter(
 	enum_class: EnumClasses,
@@ -74,3 +115,14 @@ def test_iter(
 		list(enum_class)  # type: ignore
 
 	benchmark(test)
+
+
+@parametrize_enum_classes
+def test_reversed(
+	enum_class: EnumClasses,
+	benchmark: pytest_benchmark.fixture.BenchmarkFixture,
+) -> None:
+	def test() -> None:
+		list(reversed(enum_class))  # type: ignore
+
+	benchmark(test)
@@ -0,0 +1,157 @@
+import pytest
+
+import fastenum
+
+
+class StrEnum(str, fastenum.Enum):
+	A = 'a'
+	B = 'b'
+
+
+class IntEnum(int, fastenum.Enum):
+	ONE = 1
+	TWO = 2
+
+
+def test_mixin_types() -> None:
+	assert StrEnum('b') is StrEnum.B
+	assert StrEnum.A.value == 'a'
+	assert IntEnum(2) is IntEnum.TWO
+	assert IntEnum.ONE.value == 1
+
+
+class Dense(fastenum.Enum):
+	A = 0
+	B = 1
+	C = 2
+
+
+class Aliased(fastenum.Enum):
+	A = 0
+	B = 1
+	C = 1
+
+
+class Mixed(fastenum.Enum):
+	A = 0
+	B = '1'
+	C = 2
+
+
+def test_call_dense() -> None:
+	assert Dense(0) is Dense.A
+	assert Dense(2) is Dense.C
+	# bool compares equal to int and goes through the value map like any other value
+	assert Dense(True) is Dense.B
+	assert Dense(False) is Dense.A
+
+
+def test_call_alias_last_wins() -> None:
+	assert Aliased(1) is Aliased.C
+
+
+@pytest.mark.parametrize('value', (3, -1, -3))
+def test_call_dense_out_of_range(value: int) -> None:
+	with pytest.raises(ValueError):
+		Dense(value)
+
+
+def test_call_mixed_values() -> None:
+	assert Mixed(0) is Mixed.A
+	assert Mixed('1') is Mixed.B
+	assert Mixed(2) is Mixed.C
+	with pytest.raises(ValueError):
+		Mixed(1)
+
+
+class Color(fastenum.Enum):
+	RED = 1
+	GREEN = 2
+	BLUE = 3
+
+
+class Empty(fastenum.Enum):
+	pass
+
+
+def test_str_and_repr() -> None:
+	assert str(Color.RED) == 'Color.RED'
+	assert repr(Color.RED) == '<Color.RED: 1>'
+	assert '{}'.format(Color.GREEN) == 'Color.GREEN'
+	assert '{:>11}|'.format(Color.BLUE) == ' Color.BLUE|'
+
+
+class Unhashable(fastenum.Enum):
+	LIST = [1]
+	SET = {1, 2}
+	INT = 3
+
+
+def test_call_by_value() -> None:
+	assert Color(2) is Color.GREEN
+
+
+def test_call_with_member() -> None:
+	assert Color(Color.RED) is Color.RED
+
+
+def test_call_unhashable_member_value() -> None:
+	assert Unhashable([1]) is Unhashable.LIST
+	assert Unhashable({1, 2}) is Unhashable.SET
+	assert Unhashable(3) is Unhashable.INT
+
+
+def test_call_hashable_value_equal_to_unhashable_member_value() -> None:
+	assert Unhashable(frozenset({1, 2})) is Unhashable.SET
+
+
+@pytest.mark.parametrize('value', (4, -1, 'RED', [1], None))
+def test_call_invalid_value(value: object) -> None:
+	with pytest.raises(ValueError):
+		Color(value)
+
+
+@pytest.mark.parametrize('value', (4, [2], frozenset({1})))
+def test_call_invalid_value_with_unhashable_members(value: object) -> None:
+	with pytest.raises(ValueError):
+		Unhashable(value)
+
+
+def test_iter() -> None:
+	assert list(Color) == [Color.RED, Color.GREEN, Color.BLUE]
+	assert list(Empty) == []
+
+
+def test_len() -> None:
+	assert len(Color) == 3
+	assert len(Empty) == 0
+
+
+def test_reversed() -> None:
+	assert list(reversed(Color)) == [Color.BLUE, Color.GREEN, Color.RED]
+	assert list(reversed(Empty)) == []
+
+
+class EqualToTwo:
+	'''Unhashable value comparing equal to 2.'''
+	__hash__ = None  # type: ignore
+
+	def __eq__(self, other: object) -> bool:
+		return other == 2
+
+
+def test_call_unhashable_value_with_hashable_members() -> None:
+	# Enums whose values are all hashable skip the linear search,
+	# so an unhashable value is never matched against them.
+	with pytest.raises(ValueError):
+		Color(EqualToTwo())
+
+
+class PartlyHashable(fastenum.Enum):
+	LIST = [1]
+	TWO = 2
+
+
+def test_call_unhashable_value_with_unhashable_members() -> None:
+	# Enums with an unhashable value keep the linear search for every value.
+	assert PartlyHashable(EqualToTwo()) is PartlyHashable.TWO
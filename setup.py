@@ -16,6 +16,8 @@ setup(
 	author_email = 'code@quantlane.com',
 	url = 'https://github.com/qntln/fastenum',
 	license = 'Apache 2.0',
+	# Member definition order relies on dicts preserving insertion order.
+	python_requires = '>=3.7',
 	packages = [
 		'fastenum',
 	],
@@ -29,6 +31,6 @@ setup(
 		'License :: OSI Approved :: Apache Software License',
 		'Natural Language :: English',
 		'Programming Language :: Python :: 3 :: Only',
-		'Programming Language :: Python :: 3.5',
+		'Programming Language :: Python :: 3.7',
 	],
 )